@@ -108,18 +108,19 @@ MARKET_OPTION_CATALOG: Dict[str, Dict[str, str]] = {
     "BC3R": {"category": "Hardware", "name": "Performance red brake calipers"},
 }
 
-OPTION_HINT_RULES: List[Tuple[re.Pattern[str], Tuple[str, str]]] = [
-    (re.compile(r"^(PP|PM|PBC|PRS|PBS)"), ("Paint", "Exterior paint option")),
-    (re.compile(r"^W\d+"), ("Wheels", "Wheel package")),
-    (re.compile(r"^IN"), ("Interior", "Interior trim or material")),
-    (re.compile(r"^AP|^FS|^FSD|^EAP"), ("Software", "Autopilot or software package")),
-    (re.compile(r"^SC"), ("Charging", "Supercharging config")),
-    (re.compile(r"^MDL|^MDY|^MDX"), ("Vehicle", "Model designation")),
-    (re.compile(r"^BT"), ("Battery", "Battery configuration")),
-    (re.compile(r"^ST|^RS"), ("Seating", "Seat or interior comfort")),
-    (re.compile(r"^HP|^DU|^MT"), ("Performance", "Drive-unit or performance upgrade")),
-    (re.compile(r"^PK|^PRM"), ("Package", "Equipment package")),
-    (re.compile(r"^HM|^FR|^HL|^FG"), ("Hardware", "Hardware feature")),
+# Option code prefixes mapped to a (label, description) hint; first match wins.
+OPTION_HINT_RULES: List[Tuple[Tuple[str, ...], Tuple[str, str]]] = [
+    (("PP", "PM", "PBC", "PRS", "PBS"), ("Paint", "Exterior paint option")),
+    (tuple(f"W{digit}" for digit in range(10)), ("Wheels", "Wheel package")),
+    (("IN",), ("Interior", "Interior trim or material")),
+    (("AP", "FS", "FSD", "EAP"), ("Software", "Autopilot or software package")),
+    (("SC",), ("Charging", "Supercharging config")),
+    (("MDL", "MDY", "MDX"), ("Vehicle", "Model designation")),
+    (("BT",), ("Battery", "Battery configuration")),
+    (("ST", "RS"), ("Seating", "Seat or interior comfort")),
+    (("HP", "DU", "MT"), ("Performance", "Drive-unit or performance upgrade")),
+    (("PK", "PRM"), ("Package", "Equipment package")),
+    (("HM", "FR", "HL", "FG"), ("Hardware", "Hardware feature")),
 ]
 
 DELIVERY_TYPE_DESCRIPTIONS: Dict[str, str] = {
@@ -210,7 +211,9 @@ MODEL_CODE_LABELS: Dict[str, str] = {
     "SR": "Roadster",
 }
 
-OPTION_CODE_SPLITTER = re.compile(r"[,;|\\s]+")
+OPTION_CODE_SPLITTER = re.compile(r"[,;|\s]+")
+
+NON_ALPHA_PATTERN = re.compile(r"[^A-Z]")
 
 WINDOW_DATE_PATTERN = re.compile(
     r"(?:(?P<day_first>\d{1,2})(?:st|nd|rd|th)?\s+(?P<month_first>[A-Za-z]{3,})|"
@@ -245,6 +248,22 @@ MONTH_ABBREVIATIONS = {
     "DECEMBER": "Dec",
 }
 
+# English month abbreviations, matching strftime's %b in the C locale.
+MONTH_NAMES: Tuple[str, ...] = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
 FINANCE_PRODUCT_TYPE_DESCRIPTIONS: Dict[str, str] = {
     "RETAIL_LOAN": "Retail loan",
     "LEASE": "Lease",
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from fastapi import FastAPI, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -34,6 +35,7 @@ from .utils import (
     extract_delivery_blockers,
     format_currency,
     format_date_only,
+    format_flag,
     format_timestamp,
     format_vehicle_mileage,
     shorten_delivery_window_display,
@@ -56,6 +58,7 @@ ResponseT = TypeVar("ResponseT", HTMLResponse, RedirectResponse)
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 templates = Jinja2Templates(directory=BASE_DIR / "templates")
 
+logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
 TOKEN_HEADER = "x-tesla-bundle"
@@ -271,15 +274,17 @@ def _ensure_request_tokens(
 
 
 def _collect_order_entries(access_token: str) -> List[Dict[str, Any]]:
-    basic_orders = monitor.retrieve_orders(access_token)
-    detailed_orders: List[Dict[str, Any]] = []
-    for order in basic_orders:
-        order_id = order.get("referenceNumber")
-        if not order_id:
-            continue
-        details = monitor.get_order_details(order_id, access_token)
-        detailed_orders.append({"order": order, "details": details})
-    return detailed_orders
+    basic_orders = [
+        order
+        for order in monitor.retrieve_orders(access_token)
+        if order.get("referenceNumber")
+    ]
+    order_ids = [order["referenceNumber"] for order in basic_orders]
+    order_details = monitor.get_order_details_batch(order_ids, access_token)
+    return [
+        {"order": order, "details": details}
+        for order, details in zip(basic_orders, order_details)
+    ]
 
 
 def _format_orders(order_entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -419,11 +424,11 @@ def _format_orders(order_entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 def build_order_insights(order_entry: Dict[str, Any]) -> Dict[str, Any]:
     data = unpack_order_data(order_entry)
-    order = data["order"]
-    scheduling = data["scheduling"]
-    registration = data["registration"]
-    final_payment = data["final_payment"]
-    final_payment_data = data["final_payment_data"]
+    order = data.order
+    scheduling = data.scheduling
+    registration = data.registration
+    final_payment = data.final_payment
+    final_payment_data = data.final_payment_data
 
     financing_details = (
         (final_payment_data.get("financingDetails") or {}).get("teslaFinanceDetails")
@@ -498,15 +503,21 @@ def build_order_insights(order_entry: Dict[str, Any]) -> Dict[str, Any]:
                 or (final_payment_data.get("deliveryAddress") or {}).get("address1")
                 or final_payment_data.get("pickupLocation"),
             ),
-            ("Ready To Accept", scheduling.get("readyToAccept")),
+            ("Ready To Accept", format_flag(scheduling.get("readyToAccept"))),
             ("Self-Scheduling", scheduling.get("selfSchedulingUrl")),
             (
                 "Appointment Status",
                 describe_appointment_status(scheduling.get("appointmentStatusName")),
             ),
-            ("Tesla Actions Pending", readiness.get("hasTeslaAction")),
-            ("Customer Actions Pending", readiness.get("hasCustomerAction")),
-            ("Has Blocker", readiness.get("hasBlocker")),
+            (
+                "Tesla Actions Pending",
+                format_flag(readiness.get("hasTeslaAction")),
+            ),
+            (
+                "Customer Actions Pending",
+                format_flag(readiness.get("hasCustomerAction")),
+            ),
+            ("Has Blocker", format_flag(readiness.get("hasBlocker"))),
         ]
     )
 
@@ -557,8 +568,8 @@ def build_order_insights(order_entry: Dict[str, Any]) -> Dict[str, Any]:
             ("Order Substatus", describe_order_substatus(order.get("orderSubstatus"))),
             ("Vehicle Map ID", order.get("vehicleMapId")),
             ("Locale", describe_locale(order.get("locale"))),
-            ("B2B Order", order.get("isB2b")),
-            ("Used Vehicle", order.get("isUsed")),
+            ("B2B Order", format_flag(order.get("isB2b"))),
+            ("Used Vehicle", format_flag(order.get("isUsed"))),
         ]
     )
 
@@ -577,16 +588,16 @@ def build_order_insights(order_entry: Dict[str, Any]) -> Dict[str, Any]:
 
 def build_order_progress(order_entry: Dict[str, Any]) -> Dict[str, Any]:
     data = unpack_order_data(order_entry)
-    order = data["order"]
-    details = data["details"]
-    tasks = data["tasks"]
-    scheduling = data["scheduling"]
-    registration = data["registration"]
-    final_payment = data["final_payment"]
-    final_payment_data = data["final_payment_data"]
+    order = data.order
+    details = data.details
+    tasks = data.tasks
+    scheduling = data.scheduling
+    registration = data.registration
+    final_payment = data.final_payment
+    final_payment_data = data.final_payment_data
 
     registration_details = registration.get("orderDetails", {}) or {}
-    delivery_details = data["delivery_details"]
+    delivery_details = data.delivery_details
     delivery_reg_data = delivery_details.get("regData", {}) or {}
     delivery_acceptance_task = tasks.get("deliveryAcceptance", {}) or {}
 
@@ -902,7 +913,8 @@ async def dashboard(request: Request):
         return _redirect_to_login(clear=True)
 
     try:
-        detailed_orders = _collect_order_entries(access_token)
+        # Fetching blocks (including retry backoff), so keep it off the event loop.
+        detailed_orders = await run_in_threadpool(_collect_order_entries, access_token)
     except Exception as exc:
         logger.error("Failed to fetch Tesla orders: %s", exc)
         response = HTMLResponse(
@@ -1,19 +1,37 @@
+from __future__ import annotations
+
 import base64
 import hashlib
 import json
 import logging
 import os
+import random
+import threading
 import time
 import urllib.parse
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
-
-import requests
-
-from .tesla_stores import TeslaStore
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .utils import format_iso_timestamp
+
+if TYPE_CHECKING:
+    import requests
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
 # Define constants
@@ -25,6 +43,133 @@ SCOPE = "openid email offline_access"
 CODE_CHALLENGE_METHOD = "S256"
 APP_VERSION = "9.99.9-9999"
 
+# Authorize URL parameters that never change between logins.
+_AUTH_STATIC_QUERY = urllib.parse.urlencode(
+    {
+        "client_id": CLIENT_ID,
+        "redirect_uri": REDIRECT_URI,
+        "response_type": "code",
+        "scope": SCOPE,
+        "code_challenge_method": CODE_CHALLENGE_METHOD,
+    }
+)
+
+# Retry policy for the order endpoints. Requests are served inline with a page
+# load, so attempts and per-retry sleeps are kept small.
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_REQUEST_ATTEMPTS = 3
+MAX_BACKOFF_SECONDS = 8.0
+
+# Upper bound on concurrent order detail requests (stays within the HTTP pool).
+MAX_DETAIL_WORKERS = 4
+
+# Tasks shown first, in this order; any other tasks follow.
+_PRIORITY_KEYS: Tuple[str, ...] = (
+    "deliveryDetails",
+    "tradeIn",
+    "financing",
+    "registration",
+    "insurance",
+    "scheduling",
+    "finalPayment",
+    "deliveryAcceptance",
+)
+_PRIORITY_SET = frozenset(_PRIORITY_KEYS)
+
+# Card titles and status codes that mean Tesla is still working on a task.
+_WAITING_TITLES = frozenset(
+    {
+        "check back later",
+        "we'll notify you",
+        "we will notify you",
+        "wait",
+        "waiting",
+    }
+)
+_WAITING_STATUSES = frozenset(
+    {
+        "CHECK_BACK_LATER",
+        "WAIT",
+        "WAITING",
+        "PENDING",
+        "NOT_AVAILABLE",
+        "IN_REVIEW",
+    }
+)
+
+# Decoded token expiry keyed by a digest of the token, so raw bearer tokens are
+# never retained after the request that carried them.
+_EXP_CACHE: Dict[bytes, float] = {}
+_EXP_CACHE_LIMIT = 128
+
+
+def _decode_exp(access_token: str) -> float:
+    """Return the ``exp`` claim of a JWT."""
+    # JWT segments are unpadded base64url; maxsplit skips copying the signature.
+    payload = access_token.split(".", 2)[1]
+    pad = -len(payload) % 4
+    if pad:
+        payload += "=" * pad
+    return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+
+
+def _token_expiry(access_token: str, now: float) -> float:
+    """Return a token's expiry, decoding it only the first time it is seen."""
+    key = hashlib.blake2b(access_token.encode("utf-8"), digest_size=16).digest()
+    exp = _EXP_CACHE.get(key)
+    if exp is None:
+        exp = _decode_exp(access_token)
+        if len(_EXP_CACHE) >= _EXP_CACHE_LIMIT:
+            for stale_key, stale_exp in list(_EXP_CACHE.items()):
+                if stale_exp <= now:
+                    _EXP_CACHE.pop(stale_key, None)
+            if len(_EXP_CACHE) >= _EXP_CACHE_LIMIT:
+                _EXP_CACHE.clear()
+        _EXP_CACHE[key] = exp
+    elif exp <= now:
+        # Expired tokens never become valid again; stop tracking them.
+        _EXP_CACHE.pop(key, None)
+    return exp
+
+
+def _take(differences: Iterator[str], limit: Optional[int]) -> List[str]:
+    """Collect ``differences``, stopping after ``limit`` items when it is set."""
+    return list(islice(differences, limit) if limit else differences)
+
+
+@lru_cache(maxsize=64)
+def _prefix_option_codes(options: str) -> str:
+    """Return ``options`` as a comma-joined list of ``$``-prefixed codes."""
+    return ",".join(
+        token if token.startswith("$") else f"${token}"
+        for token in (opt.strip() for opt in options.split(","))
+        if token
+    )
+
+
+@lru_cache(maxsize=1024)
+def _store_label(store_id: int) -> str:
+    """Return the display label for a Tesla store id."""
+    # The store table is only loaded once a label is actually rendered.
+    from .tesla_stores import TeslaStore
+
+    return TeslaStore.from_value(store_id).label
+
+
+def _encode_view_queries(
+    views: Iterable[str],
+    static_params: Dict[str, str],
+    overrides: Dict[str, Dict[str, str]],
+) -> Dict[str, Tuple[str, str]]:
+    """Pre-encode the view parameter and its static compositor params."""
+    return {
+        view: (
+            urllib.parse.urlencode({"view": view}),
+            urllib.parse.urlencode({**static_params, **overrides.get(view, {})}),
+        )
+        for view in views
+    }
+
 
 class TeslaOrderMonitor:
     _VIEW_LIBRARY: Dict[str, str] = {
@@ -41,38 +186,100 @@ class TeslaOrderMonitor:
         "RIMCLOSEUP": "Rim Close-Up",
     }
 
-    _DEFAULT_VIEW_SEQUENCE: List[str] = list(_VIEW_LIBRARY.keys())
+    _DEFAULT_VIEW_SEQUENCE: Tuple[str, ...] = tuple(_VIEW_LIBRARY)
+
+    _MODEL_MAP: Dict[str, str] = {
+        "ms": "ms",
+        "model s": "ms",
+        "s": "ms",
+        "m3": "m3",
+        "model 3": "m3",
+        "3": "m3",
+        "mx": "mx",
+        "model x": "mx",
+        "x": "mx",
+        "my": "my",
+        "model y": "my",
+        "y": "my",
+        "ct": "ct",
+        "cybertruck": "ct",
+    }
+
+    # Task timestamp fields surfaced in task metadata, with display labels.
+    _TIMESTAMP_FIELDS: Tuple[Tuple[str, str], ...] = (
+        ("availableAt", "Available since"),
+        ("dueDate", "Due date"),
+        ("statusDate", "Status updated"),
+        ("completedDate", "Completed at"),
+        ("statusTimestamp", "Status timestamp"),
+    )
+
+    _STATIC_COMPOSITOR_PARAMS: Dict[str, str] = {
+        "bkba_opt": "1",
+        "context": "design_studio_2",
+        "size": "1024",
+        "crop": "1150,647,390,180",
+        "hide_car_shadow": "0",
+    }
 
     _VIEW_OVERRIDES: Dict[str, Dict[str, str]] = {
         "RIMCLOSEUP": {"crop": "0,0,80,0", "size": "800"},
     }
 
-    def __init__(self):
-        pass
+    # Pre-encoded (view, static params) query pieces, built once at import.
+    _STATIC_QUERY = urllib.parse.urlencode(_STATIC_COMPOSITOR_PARAMS)
+    _VIEW_QUERIES: Dict[str, Tuple[str, str]] = _encode_view_queries(
+        [*_VIEW_LIBRARY, *_VIEW_OVERRIDES], _STATIC_COMPOSITOR_PARAMS, _VIEW_OVERRIDES
+    )
+
+    def __init__(self) -> None:
+        # The HTTP stack is imported on first use, so importing this module
+        # (e.g. for task parsing alone) does not pay for loading requests.
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """Return the shared HTTP session, creating it on first use."""
+        session = self._session
+        if session is not None:
+            return session
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                # Reuse keep-alive connections to Tesla's auth and API hosts.
+                # The adapter only retries connection-level failures; throttled
+                # and 5xx responses are retried by _request_with_backoff.
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(
+                        pool_connections=4,
+                        pool_maxsize=8,
+                        max_retries=Retry(total=3, backoff_factor=0.3),
+                    ),
+                )
+                self._session = session
+            return self._session
 
     def generate_login_params(self) -> Dict[str, str]:
         state = os.urandom(16).hex()
-        code_verifier = (
-            base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=").decode("utf-8")
-        )
+        # Hash the verifier bytes directly; it is decoded to text only once.
+        verifier_bytes = base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=")
+        code_verifier = verifier_bytes.decode("ascii")
         code_challenge = (
-            base64.urlsafe_b64encode(
-                hashlib.sha256(code_verifier.encode("utf-8")).digest()
-            )
+            base64.urlsafe_b64encode(hashlib.sha256(verifier_bytes).digest())
             .rstrip(b"=")
-            .decode("utf-8")
+            .decode("ascii")
         )
 
-        auth_params = {
-            "client_id": CLIENT_ID,
-            "redirect_uri": REDIRECT_URI,
-            "response_type": "code",
-            "scope": SCOPE,
-            "state": state,
-            "code_challenge": code_challenge,
-            "code_challenge_method": CODE_CHALLENGE_METHOD,
-        }
-        auth_url = f"{AUTH_URL}?{urllib.parse.urlencode(auth_params)}"
+        # state is hex and code_challenge is unpadded base64url: both URL-safe.
+        auth_url = (
+            f"{AUTH_URL}?{_AUTH_STATIC_QUERY}"
+            f"&state={state}&code_challenge={code_challenge}"
+        )
 
         return {"state": state, "code_verifier": code_verifier, "auth_url": auth_url}
 
@@ -93,16 +300,14 @@ class TeslaOrderMonitor:
             "redirect_uri": REDIRECT_URI,
             "code_verifier": code_verifier,
         }
-        response = requests.post(TOKEN_URL, data=token_data)
+        response = self._get_session().post(TOKEN_URL, data=token_data)
         response.raise_for_status()
         return response.json()
 
     def is_token_valid(self, access_token: str) -> bool:
+        now = time.time()
         try:
-            jwt_decoded = json.loads(
-                base64.b64decode(access_token.split(".")[1] + "==").decode("utf-8")
-            )
-            return jwt_decoded["exp"] > time.time()
+            return _token_expiry(access_token, now) > now
         except Exception:
             return False
 
@@ -112,15 +317,16 @@ class TeslaOrderMonitor:
             "client_id": CLIENT_ID,
             "refresh_token": refresh_token,
         }
-        response = requests.post(TOKEN_URL, data=token_data)
+        response = self._get_session().post(TOKEN_URL, data=token_data)
         response.raise_for_status()
         return response.json()
 
     def retrieve_orders(self, access_token: str) -> List[Dict[str, Any]]:
         headers = {"Authorization": f"Bearer {access_token}"}
         api_url = "https://owner-api.teslamotors.com/api/1/users/orders"
-        response = requests.get(api_url, headers=headers)
-        response.raise_for_status()
+        response = self._request_with_backoff(
+            lambda: self._get_session().get(api_url, headers=headers)
+        )
         return response.json()["response"]
 
     def get_order_details(self, order_id: str, access_token: str) -> Dict[str, Any]:
@@ -132,46 +338,147 @@ class TeslaOrderMonitor:
             "referenceNumber": order_id,
             "appVersion": APP_VERSION,
         }
-        response = requests.get(api_url, headers=headers, params=query_params)
-        response.raise_for_status()
+        response = self._request_with_backoff(
+            lambda: self._get_session().get(
+                api_url, headers=headers, params=query_params
+            )
+        )
         return response.json()
 
-    def compare_dicts(
-        self, old_dict: Dict[str, Any], new_dict: Dict[str, Any], path: str = ""
-    ) -> List[str]:
-        differences = []
-        for key in old_dict:
-            if key not in new_dict:
-                differences.append(f"- Removed key '{path + key}'")
-            elif isinstance(old_dict[key], dict) and isinstance(new_dict[key], dict):
-                differences.extend(
-                    self.compare_dicts(old_dict[key], new_dict[key], path + key + ".")
-                )
-            elif old_dict[key] != new_dict[key]:
-                differences.append(
-                    f"CHANGE: {path + key}: {old_dict[key]} -> {new_dict[key]}"
+    def get_order_details_batch(
+        self, order_ids: List[str], access_token: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch details for several orders concurrently, preserving order."""
+        if len(order_ids) <= 1:
+            return [
+                self.get_order_details(order_id, access_token) for order_id in order_ids
+            ]
+        workers = min(len(order_ids), MAX_DETAIL_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda order_id: self.get_order_details(order_id, access_token),
+                    order_ids,
                 )
+            )
 
-        for key in new_dict:
-            if key not in old_dict:
-                differences.append(f"+ Added key '{path + key}': {new_dict[key]}")
+    def _request_with_backoff(
+        self,
+        send: Callable[[], requests.Response],
+        max_attempts: int = MAX_REQUEST_ATTEMPTS,
+    ) -> requests.Response:
+        """Send a request, retrying 429/5xx responses with jittered backoff.
+
+        Honors ``Retry-After`` when Tesla provides it; a wait longer than
+        ``MAX_BACKOFF_SECONDS`` is not retried early, the error is raised
+        instead. Without the header it sleeps a random amount up to
+        ``2**attempt`` seconds so concurrent clients desynchronize.
+        """
+        for attempt in range(max_attempts):
+            response = send()
+            if (
+                response.status_code not in RETRYABLE_STATUS_CODES
+                or attempt == max_attempts - 1
+            ):
+                break
+            delay = self._retry_after_seconds(response)
+            if delay is None:
+                delay = min(random.uniform(0, 2**attempt), MAX_BACKOFF_SECONDS)
+            elif delay > MAX_BACKOFF_SECONDS:
+                break
+            logger.info(
+                "Tesla API returned %s, retrying in %.1fs",
+                response.status_code,
+                delay,
+            )
+            response.close()
+            time.sleep(delay)
+        response.raise_for_status()
+        return response
 
-        return differences
+    @staticmethod
+    def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def compare_dicts(
+        self,
+        old_dict: Dict[str, Any],
+        new_dict: Dict[str, Any],
+        path: str = "",
+        max_diffs: Optional[int] = None,
+    ) -> List[str]:
+        """Return human-readable differences between two nested dicts.
+
+        When ``max_diffs`` is set, stop as soon as that many differences are
+        found (``max_diffs=1`` answers "did anything change?")."""
+        return _take(self._iter_dict_differences(old_dict, new_dict, path), max_diffs)
 
     def compare_orders(
-        self, old_orders: List[Dict[str, Any]], new_orders: List[Dict[str, Any]]
+        self,
+        old_orders: List[Dict[str, Any]],
+        new_orders: List[Dict[str, Any]],
+        max_diffs: Optional[int] = None,
     ) -> List[str]:
-        differences = []
-        for i, old_order in enumerate(old_orders):
-            if i < len(new_orders):
-                differences.extend(
-                    self.compare_dicts(old_order, new_orders[i], path=f"Order {i}.")
-                )
-            else:
-                differences.append(f"- Removed order {i}")
-        for i in range(len(old_orders), len(new_orders)):
-            differences.append(f"+ Added order {i}")
-        return differences
+        return _take(self._iter_order_differences(old_orders, new_orders), max_diffs)
+
+    def _iter_dict_differences(
+        self, old_dict: Dict[str, Any], new_dict: Dict[str, Any], path: str
+    ) -> Iterator[str]:
+        # Unchanged payloads are the common case; a C-level == settles them
+        # without walking the tree in Python.
+        if old_dict is new_dict or old_dict == new_dict:
+            return
+        # Walk nested dicts from a FIFO worklist instead of recursing, so nested
+        # differences are reported level by level in document order.
+        pending: Deque[Tuple[Dict[str, Any], Dict[str, Any], str]] = deque(
+            [(old_dict, new_dict, path)]
+        )
+        while pending:
+            old, new, prefix = pending.popleft()
+            shared = 0
+            for key, old_value in old.items():
+                if key not in new:
+                    yield f"- Removed key '{prefix + key}'"
+                    continue
+                shared += 1
+                new_value = new[key]
+                if old_value is new_value:
+                    continue
+                if isinstance(old_value, dict) and isinstance(new_value, dict):
+                    # Queue without comparing: a deep != here would re-walk the
+                    # subtree once per ancestor level.
+                    pending.append((old_value, new_value, prefix + key + "."))
+                elif old_value != new_value:
+                    yield f"CHANGE: {prefix + key}: {old_value} -> {new_value}"
+
+            # Only scan for added keys when the new dict has keys we did not see.
+            if shared < len(new):
+                for key, new_value in new.items():
+                    if key not in old:
+                        yield f"+ Added key '{prefix + key}': {new_value}"
+
+    def _iter_order_differences(
+        self, old_orders: List[Dict[str, Any]], new_orders: List[Dict[str, Any]]
+    ) -> Iterator[str]:
+        if old_orders is new_orders or old_orders == new_orders:
+            return
+        # _iter_dict_differences skips identical and equal pairs itself.
+        for i, (old_order, new_order) in enumerate(zip(old_orders, new_orders)):
+            yield from self._iter_dict_differences(old_order, new_order, f"Order {i}.")
+        old_count, new_count = len(old_orders), len(new_orders)
+        for i in range(new_count, old_count):
+            yield f"- Removed order {i}"
+        for i in range(old_count, new_count):
+            yield f"+ Added order {i}"
 
     def ensure_authenticated(
         self, token_bundle: Optional[Dict[str, Any]]
@@ -197,17 +504,16 @@ class TeslaOrderMonitor:
                 # Merge to keep any additional fields Tesla returns
                 token_bundle.update(token_response)
             except Exception as e:
-                logger.error(f"Failed to refresh token: {e}")
+                logger.error("Failed to refresh token: %s", e)
                 return None, None
 
         return access_token, token_bundle
 
     def get_store_label(self, routing_loc: Any) -> str:
         try:
-            store_id = int(routing_loc)
+            return _store_label(int(routing_loc))
         except (TypeError, ValueError):
             return "Unknown Store"
-        return TeslaStore.from_value(store_id).label
 
     def get_vehicle_image_urls(
         self, model_code: str, options: str, views: Optional[List[str]] = None
@@ -219,36 +525,46 @@ class TeslaOrderMonitor:
 
         formatted_options = self._format_option_string(options)
         option_string = formatted_options or (options or "")
-        base_url = "https://static-assets.tesla.com/configurator/compositor"
 
         if views:
-            requested_views = []
-            for view in views:
-                if not view:
-                    continue
-                requested_views.append(view.strip().upper())
+            requested_views = tuple(view.strip().upper() for view in views if view)
         else:
             requested_views = self._DEFAULT_VIEW_SEQUENCE
 
-        image_metadata: List[Dict[str, str]] = []
-        for view_code in requested_views:
-            label = self._VIEW_LIBRARY.get(
-                view_code, view_code.replace("_", " ").title()
+        # Hand out fresh dicts so callers cannot mutate the cached entries.
+        return [
+            {"url": url, "view": view_code, "label": label}
+            for url, view_code, label in self._build_image_entries(
+                model_token, option_string, requested_views
             )
-            params = self._build_compositor_params(
-                model_token, option_string, view_code
+        ]
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _build_image_entries(
+        cls, model_token: str, option_string: str, views: Tuple[str, ...]
+    ) -> Tuple[Tuple[str, str, str], ...]:
+        """Build (url, view, label) entries; repeat renders hit the cache."""
+        base_url = "https://static-assets.tesla.com/configurator/compositor"
+        # Only model and options vary per order; view pieces are pre-encoded.
+        model_query = urllib.parse.urlencode({"model": model_token})
+        options_query = (
+            urllib.parse.urlencode({"options": option_string}) if option_string else ""
+        )
+
+        entries: List[Tuple[str, str, str]] = []
+        for view_code in views:
+            label = cls._VIEW_LIBRARY.get(
+                view_code, view_code.replace("_", " ").title()
             )
-            if not params:
-                continue
-            query = urllib.parse.urlencode(params)
-            image_metadata.append(
-                {
-                    "url": f"{base_url}?{query}",
-                    "view": view_code,
-                    "label": label,
-                }
+            view_query, static_query = cls._VIEW_QUERIES.get(view_code) or (
+                urllib.parse.urlencode({"view": view_code}) if view_code else "",
+                cls._STATIC_QUERY,
             )
-        return image_metadata
+            query_parts = (model_query, view_query, options_query, static_query)
+            query = "&".join(part for part in query_parts if part)
+            entries.append((f"{base_url}?{query}", view_code, label))
+        return tuple(entries)
 
     def get_vehicle_image_url(self, model_code: str, options: str) -> str:
         """Backward compatible helper that returns the primary (front three-quarter) image."""
@@ -259,55 +575,12 @@ class TeslaOrderMonitor:
         if not model_code:
             return None
         normalized = model_code.strip()
-        token = normalized.lower()
-        mapping = {
-            "ms": "ms",
-            "model s": "ms",
-            "s": "ms",
-            "m3": "m3",
-            "model 3": "m3",
-            "3": "m3",
-            "mx": "mx",
-            "model x": "mx",
-            "x": "mx",
-            "my": "my",
-            "model y": "my",
-            "y": "my",
-            "ct": "ct",
-            "cybertruck": "ct",
-        }
-        return mapping.get(token, normalized)
+        return self._MODEL_MAP.get(normalized.lower(), normalized)
 
     def _format_option_string(self, options: str) -> str:
         if not options:
             return ""
-        tokens = [opt.strip() for opt in options.split(",") if opt and opt.strip()]
-        formatted = []
-        for token in tokens:
-            if token.startswith("$"):
-                formatted.append(token)
-            else:
-                formatted.append(f"${token}")
-        return ",".join(formatted)
-
-    def _build_compositor_params(
-        self, model_token: str, option_string: str, view_code: str
-    ) -> Dict[str, str]:
-        if not model_token:
-            return {}
-        base_params = {
-            "model": model_token,
-            "view": view_code,
-            "options": option_string,
-            "bkba_opt": "1",
-            "context": "design_studio_2",
-            "size": "1024",
-            "crop": "1150,647,390,180",
-            "hide_car_shadow": "0",
-        }
-        overrides = self._VIEW_OVERRIDES.get(view_code, {})
-        base_params.update(overrides)
-        return {k: v for k, v in base_params.items() if v not in (None, "")}
+        return _prefix_option_codes(options)
 
     def parse_tasks(self, tasks_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Parses the tasks dictionary into a sorted list of steps."""
@@ -317,20 +590,8 @@ class TeslaOrderMonitor:
 
         parsed_tasks = []
 
-        # specific order we want to show
-        priority_keys = [
-            "deliveryDetails",
-            "tradeIn",
-            "financing",
-            "registration",
-            "insurance",
-            "scheduling",
-            "finalPayment",
-            "deliveryAcceptance",
-        ]
-
         # First add priority tasks
-        for key in priority_keys:
+        for key in _PRIORITY_KEYS:
             if key in tasks_data:
                 task = tasks_data[key]
                 parsed_tasks.append(self._format_task(task, key))
@@ -338,7 +599,7 @@ class TeslaOrderMonitor:
         # Add any others not in priority list
         for key, task in tasks_data.items():
             if (
-                key not in priority_keys
+                key not in _PRIORITY_SET
                 and isinstance(task, dict)
                 and "complete" in task
             ):
@@ -373,46 +634,26 @@ class TeslaOrderMonitor:
         status_label = self._humanize_status(status_raw)
         status_token = str(status_raw).upper()
 
-        detail_candidates = [
-            card.get("subtitle"),
-            card.get("messageBody"),
-            card.get("messageTitle"),
-            strings.get("subtitle"),
-            strings.get("messageBody"),
-            strings.get("messageTitle"),
-            (
-                strings.get("checkBackLater")
-                if isinstance(strings.get("checkBackLater"), str)
-                else None
-            ),
-        ]
-        detail_text = next(
-            (str(text).strip() for text in detail_candidates if text), None
+        check_back_later = strings.get("checkBackLater")
+        detail = (
+            card.get("subtitle")
+            or card.get("messageBody")
+            or card.get("messageTitle")
+            or strings.get("subtitle")
+            or strings.get("messageBody")
+            or strings.get("messageTitle")
+            or (check_back_later if isinstance(check_back_later, str) else None)
         )
+        detail_text = str(detail).strip() if detail else None
 
-        waiting_titles = {
-            "check back later",
-            "we'll notify you",
-            "we will notify you",
-            "wait",
-            "waiting",
-        }
-        waiting_statuses = {
-            "CHECK_BACK_LATER",
-            "WAIT",
-            "WAITING",
-            "PENDING",
-            "NOT_AVAILABLE",
-            "IN_REVIEW",
-        }
         card_title = (card.get("title") or "").strip().lower()
         enabled = task.get("enabled", True)
         complete = task.get("complete", False)
 
         waiting = (
             (not enabled and not complete)
-            or (status_token in waiting_statuses)
-            or (card_title in waiting_titles)
+            or (status_token in _WAITING_STATUSES)
+            or (card_title in _WAITING_TITLES)
         )
         actionable = (not complete) and (not waiting)
 
@@ -420,16 +661,14 @@ class TeslaOrderMonitor:
         if waiting and not complete:
             wait_reason = detail_text or "Tesla is still preparing this step."
 
-        cta_url = None
-        target_candidate = card.get("target")
-        card_target = target_candidate if isinstance(target_candidate, str) else None
+        # Scheduling links live on the task; every other task (finalPayment
+        # included) uses the card target when it is an absolute URL.
         if task_key == "scheduling":
             cta_url = task.get("selfSchedulingUrl")
-        elif task_key == "finalPayment":
-            if card_target and card_target.startswith("http"):
-                cta_url = card_target
-        elif card_target and card_target.startswith("http"):
-            cta_url = card_target
+        else:
+            target = card.get("target")
+            is_http = isinstance(target, str) and target[:4] == "http"
+            cta_url = target if is_http else None
 
         cta_label = (
             strings.get("ctaLabel")
@@ -489,26 +728,14 @@ class TeslaOrderMonitor:
         raw_data = task.get("data")
         data_section = raw_data if isinstance(raw_data, dict) else {}
 
-        timestamp_fields = [
-            ("availableAt", "Available since"),
-            ("dueDate", "Due date"),
-            ("statusDate", "Status updated"),
-            ("completedDate", "Completed at"),
-            ("statusTimestamp", "Status timestamp"),
-        ]
-
-        for field, label in timestamp_fields:
-            value = task.get(field) or data_section.get(field)
+        task_get = task.get
+        data_get = data_section.get
+        for field, label in self._TIMESTAMP_FIELDS:
+            value = task_get(field) or data_get(field)
             if value:
                 add(label, self._format_task_timestamp(value))
 
         return metadata
 
     def _format_task_timestamp(self, value: Any) -> str:
-        try:
-            raw = str(value)
-            if raw.endswith("Z"):
-                raw = raw[:-1] + "+00:00"
-            return datetime.fromisoformat(raw).strftime("%d %b %Y %H:%M")
-        except Exception:
-            return str(value)
+        return format_iso_timestamp(str(value))
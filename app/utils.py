@@ -1,8 +1,9 @@
 import math
-import re
-from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from .constants import (
     APPOINTMENT_STATUS_DESCRIPTIONS,
@@ -14,6 +15,8 @@ from .constants import (
     MARKET_OPTION_CATALOG,
     MODEL_CODE_LABELS,
     MONTH_ABBREVIATIONS,
+    MONTH_NAMES,
+    NON_ALPHA_PATTERN,
     OPTION_CODE_SPLITTER,
     OPTION_HINT_RULES,
     ORDER_STATUS_DESCRIPTIONS,
@@ -34,18 +37,23 @@ def format_vehicle_mileage(value: Any, unit: Optional[Any]) -> Optional[str]:
         return None
 
     token = text.replace(",", " ").split()[0]
-    try:
-        numeric = float(token)
-        if not math.isfinite(numeric):
-            raise ValueError
-    except (ValueError, TypeError):
-        return text
-
-    if abs(numeric - round(numeric)) < 0.01:
-        numeric = round(numeric)
-        formatted_number = f"{numeric:,d}"
+    # Odometers are almost always whole numbers; skip the float round-trip.
+    # Longer digit runs keep the float path, which returns ``text`` on overflow.
+    digits = token[1:] if token[:1] == "-" else token
+    if digits.isdecimal() and len(digits) <= 15:
+        formatted_number = f"{int(token):,d}"
     else:
-        formatted_number = f"{numeric:,.2f}"
+        try:
+            numeric = float(token)
+            if not math.isfinite(numeric):
+                raise ValueError
+        except (ValueError, TypeError):
+            return text
+
+        if abs(numeric - round(numeric)) < 0.01:
+            formatted_number = f"{round(numeric):,d}"
+        else:
+            formatted_number = f"{numeric:,.2f}"
 
     unit_token = str(unit or "mi").strip().lower()
     if unit_token in {"km", "kilometer", "kilometers", "kilometre", "kilometres"}:
@@ -68,30 +76,48 @@ def format_currency(amount: Any, currency: Optional[str]) -> Optional[str]:
     return f"{currency} {formatted}".strip() if currency else formatted
 
 
+@lru_cache(maxsize=2048)
+def _parse_iso(raw: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(raw[:-1] + "+00:00" if raw.endswith("Z") else raw)
+    except ValueError:
+        return None
+
+
+def format_iso_timestamp(raw: str) -> str:
+    """Format an ISO-8601 string for display; parsing is cached per string."""
+    parsed = _parse_iso(raw)
+    if parsed is None:
+        return raw
+    return (
+        f"{parsed.day:02d} {MONTH_NAMES[parsed.month - 1]} {parsed.year} "
+        f"{parsed.hour:02d}:{parsed.minute:02d}"
+    )
+
+
 def format_timestamp(value: Any) -> Optional[str]:
     if not value:
         return None
-    try:
-        raw = str(value)
-        if raw.endswith("Z"):
-            raw = raw[:-1] + "+00:00"
-        return datetime.fromisoformat(raw).strftime("%d %b %Y %H:%M")
-    except Exception:  # pragma: no cover - fallback
-        return str(value)
+    return format_iso_timestamp(str(value))
 
 
 def format_date_only(value: Any) -> Optional[str]:
-    formatted = format_timestamp(value)
-    if not formatted:
+    if not value:
         return None
-    tokens = formatted.split()
-    if len(tokens) >= 3:
-        return " ".join(tokens[:3])
-    return formatted
-
-
+    raw = str(value)
+    parsed = _parse_iso(raw)
+    if parsed is None:
+        # Unparseable values keep their first three words, e.g. "12 May 2025".
+        tokens = raw.split()
+        if len(tokens) >= 3:
+            return " ".join(tokens[:3])
+        return raw or None
+    return f"{parsed.day:02d} {MONTH_NAMES[parsed.month - 1]} {parsed.year}"
+
+
+@lru_cache(maxsize=512)
 def abbreviate_month_token(token: str) -> Optional[str]:
-    cleaned = re.sub(r"[^A-Z]", "", token.upper()) if token else ""
+    cleaned = NON_ALPHA_PATTERN.sub("", token.upper()) if token else ""
     if not cleaned:
         return None
     if cleaned in MONTH_ABBREVIATIONS:
@@ -108,6 +134,12 @@ def shorten_delivery_window_display(value: Any) -> Optional[str]:
     text = " ".join(str(value).split())
     if not text:
         return None
+    return _shorten_window_text(text)
+
+
+@lru_cache(maxsize=256)
+def _shorten_window_text(text: str) -> Optional[str]:
+    # Delivery windows repeat across orders and polls, so parse each text once.
     matches: List[Tuple[str, int]] = []
     for match in WINDOW_DATE_PATTERN.finditer(text):
         if match.group("day_first"):
@@ -130,11 +162,8 @@ def shorten_delivery_window_display(value: Any) -> Optional[str]:
         return None
     (start_month, start_day), (end_month, end_day) = matches[:2]
 
-    def format_day_month(month: str, day: int) -> str:
-        return f"{day:02d} {month}"
-
-    start_display = format_day_month(start_month, start_day)
-    end_display = format_day_month(end_month, end_day)
+    start_display = f"{start_day:02d} {start_month}"
+    end_display = f"{end_day:02d} {end_month}"
     if start_display == end_display:
         return start_display
     return f"{start_display} - {end_display}"
@@ -142,7 +171,8 @@ def shorten_delivery_window_display(value: Any) -> Optional[str]:
 
 def format_rich_value(value: str) -> str:
     text = value.strip()
-    if text.startswith(("http://", "https://")):
+    # Most values are plain text; only probe the URL prefixes when one could match.
+    if "://" in text and text.startswith(("http://", "https://")):
         return (
             f'<a href="{text}" target="_blank" rel="noopener" '
             'class="text-zinc-100 underline decoration-zinc-500/60 underline-offset-2 hover:text-white">'
@@ -151,20 +181,33 @@ def format_rich_value(value: str) -> str:
     return text
 
 
+def format_flag(value: Any) -> Any:
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    return value
+
+
 def build_items(pairs: List[Tuple[str, Any]]) -> List[Dict[str, str]]:
+    """Build label/value items; boolean fields should go through format_flag."""
     items: List[Dict[str, str]] = []
     for label, value in pairs:
         if value in (None, "", []):
             continue
-        if isinstance(value, bool):
-            display = "Yes" if value else "No"
-        else:
-            display = str(value)
+        display = value if isinstance(value, str) else str(value)
         items.append({"label": label, "value": format_rich_value(display)})
     return items
 
 
 def normalize_option_code(value: Any) -> Optional[str]:
+    # Codes usually arrive clean and upper-case; return those without copying.
+    if (
+        isinstance(value, str)
+        and value.isupper()
+        and value[0] != "$"
+        and not value[0].isspace()
+        and not value[-1].isspace()
+    ):
+        return value
     if value in (None, ""):
         return None
     text = str(value).strip().upper()
@@ -229,7 +272,12 @@ def lookup_trim_label(order: Dict[str, Any], details: Dict[str, Any]) -> Optiona
 
 
 def describe_model_code(value: Any) -> str:
-    token = str(value or "").strip().upper()
+    return _describe_model_token(str(value or ""))
+
+
+@lru_cache(maxsize=512)
+def _describe_model_token(raw: str) -> str:
+    token = raw.strip().upper()
     if not token:
         return "Tesla"
     if token in MODEL_CODE_LABELS:
@@ -259,65 +307,74 @@ def derive_model_labels(
     return base_label, full_label
 
 
+def _index_option_hints() -> Dict[str, List[Tuple[Tuple[str, ...], Tuple[str, str]]]]:
+    """Group OPTION_HINT_RULES by leading character, keeping rule order."""
+    index: Dict[str, List[Tuple[Tuple[str, ...], Tuple[str, str]]]] = {}
+    for prefixes, hint in OPTION_HINT_RULES:
+        for first in dict.fromkeys(prefix[0] for prefix in prefixes):
+            matching = tuple(prefix for prefix in prefixes if prefix[0] == first)
+            index.setdefault(first, []).append((matching, hint))
+    return index
+
+
+_OPTION_HINT_INDEX = _index_option_hints()
+
+
+@lru_cache(maxsize=512)
 def infer_option_hint(code: str) -> Tuple[str, str]:
     if not code:
         return "Option", "Unrecognized option"
-    for pattern, (label, description) in OPTION_HINT_RULES:
-        if pattern.match(code):
-            return label, description
+    for prefixes, hint in _OPTION_HINT_INDEX.get(code[0], ()):
+        if code.startswith(prefixes):
+            return hint
     return "Option", "Custom configuration"
 
 
+# Catalog display strings ("Name (CODE)") and categories, resolved once.
+_OPTION_DISPLAY_NAMES: Dict[str, str] = {
+    code: info["name"] if code in info["name"] else f"{info['name']} ({code})"
+    for code, info in MARKET_OPTION_CATALOG.items()
+}
+_OPTION_CATEGORIES: Dict[str, str] = {
+    code: info["category"] for code, info in MARKET_OPTION_CATALOG.items()
+}
+
+
 def describe_market_options(option_blob: Any) -> List[Dict[str, str]]:
     if not option_blob:
         return []
 
-    codes: List[str] = []
-    if isinstance(option_blob, str):
-        codes = [
-            code.strip().upper()
-            for code in re.split(r"[,;|\s]+", option_blob)
-            if code.strip()
-        ]
-    elif isinstance(option_blob, (list, tuple, set)):
-        codes = [str(code).strip().upper() for code in option_blob if code]
-    elif isinstance(option_blob, dict):
+    if isinstance(option_blob, dict):
         possible = (
             option_blob.get("optionCodes")
             or option_blob.get("options")
             or option_blob.get("codes")
         )
         if isinstance(possible, (list, tuple, set)):
-            codes = [str(code).strip().upper() for code in possible if code]
+            option_blob = possible
         else:
-            codes = [
-                str(value).strip().upper()
-                for value in option_blob.values()
-                if isinstance(value, str)
+            option_blob = [
+                value for value in option_blob.values() if isinstance(value, str)
             ]
+    codes = split_option_codes(option_blob)
 
     if not codes:
         return []
 
-    grouped: Dict[str, List[str]] = defaultdict(list)
+    # Per-category dicts dedupe entries on insert while keeping first-seen order.
+    grouped: Dict[str, Dict[str, None]] = {}
     unknown: List[str] = []
     for code in codes:
-        info = MARKET_OPTION_CATALOG.get(code)
-        if info:
-            entry = info["name"]
-            if code not in entry:
-                entry = f"{entry} ({code})"
-            grouped[info["category"]].append(entry)
+        entry = _OPTION_DISPLAY_NAMES.get(code)
+        if entry:
+            grouped.setdefault(_OPTION_CATEGORIES[code], {})[entry] = None
         else:
             unknown.append(code)
 
-    items: List[Dict[str, str]] = []
-    for category, values in sorted(grouped.items()):
-        if not values:
-            continue
-        items.append(
-            {"label": f"{category} Options", "value": ", ".join(dict.fromkeys(values))}
-        )
+    items: List[Dict[str, str]] = [
+        {"label": f"{category} Options", "value": ", ".join(entries)}
+        for category, entries in sorted(grouped.items())
+    ]
 
     for code in dict.fromkeys(sorted(unknown)):
         label, description = infer_option_hint(code)
@@ -329,9 +386,15 @@ def describe_market_options(option_blob: Any) -> List[Dict[str, str]]:
 def describe_code(value: Any, mapping: Dict[str, str]) -> Optional[str]:
     if not value:
         return value
-    key = str(value).upper()
-    if key in mapping:
-        return mapping[key]
+    key = value if isinstance(value, str) and value.isupper() else str(value).upper()
+    described = mapping.get(key)
+    if described is not None:
+        return described
+    return _humanize_code(key)
+
+
+@lru_cache(maxsize=1024)
+def _humanize_code(key: str) -> str:
     return key.replace("_", " ").title()
 
 
@@ -412,35 +475,47 @@ def extract_delivery_blockers(readiness: Dict[str, Any]) -> List[Dict[str, str]]
     return blockers
 
 
-def unpack_order_data(order_entry: Dict[str, Any]) -> Dict[str, Any]:
+# Shared read-only stand-in for missing sections, so lookups need no new dicts.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class UnpackedOrder:
+    """Commonly used sections of an order entry."""
+
+    order: Mapping[str, Any]
+    details: Mapping[str, Any]
+    tasks: Mapping[str, Any]
+    scheduling: Mapping[str, Any]
+    registration: Mapping[str, Any]
+    final_payment: Mapping[str, Any]
+    final_payment_data: Mapping[str, Any]
+    delivery_details: Mapping[str, Any]
+
+
+def unpack_order_data(order_entry: Dict[str, Any]) -> UnpackedOrder:
     """
     Extract common fields from the order entry structure.
-    Returns a dictionary with keys:
-      - order
-      - details
-      - tasks
-      - scheduling
-      - registration
-      - final_payment
-      - final_payment_data
-      - delivery_details
+    Missing sections are returned as an empty read-only mapping.
     """
-    order = order_entry.get("order", {}) or {}
-    details = order_entry.get("details", {}) or {}
-    tasks = details.get("tasks", {}) or {}
+    order = order_entry.get("order") or _EMPTY
+    details = order_entry.get("details") or _EMPTY
+    tasks = details.get("tasks") or _EMPTY
 
-    final_payment = tasks.get("finalPayment", {}) or {}
+    final_payment = tasks.get("finalPayment") or _EMPTY
     final_payment_data = (
-        final_payment.get("data", {}) if isinstance(final_payment, dict) else {}
+        final_payment.get("data", _EMPTY)
+        if isinstance(final_payment, Mapping)
+        else _EMPTY
     )
 
-    return {
-        "order": order,
-        "details": details,
-        "tasks": tasks,
-        "scheduling": tasks.get("scheduling", {}) or {},
-        "registration": tasks.get("registration", {}) or {},
-        "final_payment": final_payment,
-        "final_payment_data": final_payment_data,
-        "delivery_details": tasks.get("deliveryDetails", {}) or {},
-    }
+    return UnpackedOrder(
+        order=order,
+        details=details,
+        tasks=tasks,
+        scheduling=tasks.get("scheduling") or _EMPTY,
+        registration=tasks.get("registration") or _EMPTY,
+        final_payment=final_payment,
+        final_payment_data=final_payment_data,
+        delivery_details=tasks.get("deliveryDetails") or _EMPTY,
+    )
@@ -12,14 +12,21 @@ from __future__ import annotations
 import json
 import pathlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Dict, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 if TYPE_CHECKING:  # pragma: no cover - hinting helper
     from app.vin_decoder import VinDecoder
 
 VPIC_URL = "https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVinValues/{vin}?format=json"
+MAX_WORKERS = 4
+
+# One keep-alive pool for all VPIC lookups instead of a TLS handshake per VIN.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=MAX_WORKERS))
 
 SAMPLE_VINS: Dict[str, str] = {
     "Model S": "5YJSA1E26HF000337",
@@ -51,7 +58,7 @@ KEYS_TO_COMPARE: Tuple[Tuple[str, str], ...] = (
 
 
 def decode_official(vin: str) -> Dict[str, str]:
-    response = requests.get(VPIC_URL.format(vin=vin), timeout=30)
+    response = _SESSION.get(VPIC_URL.format(vin=vin), timeout=30)
     response.raise_for_status()
     payload = response.json()
     result = payload.get("Results", [{}])[0]
@@ -81,9 +88,10 @@ def compare_values(label: str, internal: str | None, official: str | None) -> st
 
 def main() -> None:
     decoder = load_decoder()
-    for name, vin in SAMPLE_VINS.items():
-        ours = decoder.decode(vin)
-        official = decode_official(vin)
+    decoded = decoder.decode_batch(SAMPLE_VINS.values())
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        officials = list(executor.map(decode_official, SAMPLE_VINS.values()))
+    for (name, vin), ours, official in zip(SAMPLE_VINS.items(), decoded, officials):
         print("=" * 80)
         print(f"{name} — {vin}")
         if ours is None: